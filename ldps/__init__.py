@@ -0,0 +1,7 @@
+"""
+L-DPS (Logbook & Data Persistence Service)
+
+This module is the immutable ledger for all logged performance data.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,7 @@
+"""
+API Routes for L-DPS
+"""
+
+from fastapi import APIRouter
+
+router = APIRouter()
@@ -0,0 +1,166 @@
+"""
+API endpoints for workout log management
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import orjson
+
+from database.connection import get_db
+from models.schemas import LogEntryCreate, LogEntryResponse, SessionResponse
+from database import crud
+
+router = APIRouter()
+
+# Serialization adapters built once at import time; returning a raw
+# Response from their dump_json skips FastAPI's response_model
+# re-validation pass on the hot endpoints
+LOG_RESP_ADAPTER = TypeAdapter(LogEntryResponse)
+LOG_LIST_ADAPTER = TypeAdapter(List[LogEntryResponse])
+
+
+@router.post("/", response_model=LogEntryResponse, status_code=201)
+async def create_log(
+    log: LogEntryCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Log a single performed set
+
+    Args:
+        log: Log entry data for one set
+        db: Database session
+
+    Returns:
+        The stored LogEntryResponse
+    """
+    try:
+        log_entry = await crud.create_log_entry(db, log.model_dump())
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Conflicting log entry")
+
+    # Delegate attribute extraction to pydantic-core
+    entry = LogEntryResponse.model_validate(log_entry)
+    return Response(
+        content=LOG_RESP_ADAPTER.dump_json(entry),
+        status_code=201,
+        media_type="application/json"
+    )
+
+
+@router.post("/batch", response_model=List[LogEntryResponse], status_code=201)
+async def create_logs_batch(
+    logs: List[LogEntryCreate],
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Log several performed sets in one transaction
+
+    Args:
+        logs: Log entry data for a batch of sets
+        db: Database session
+
+    Returns:
+        List of stored LogEntryResponse, in input order
+    """
+    try:
+        entries = await crud.create_log_entries_bulk(db, [log.model_dump() for log in logs])
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Conflicting log entries in batch")
+
+    responses = [LogEntryResponse.model_validate(entry) for entry in entries]
+    return Response(
+        content=LOG_LIST_ADAPTER.dump_json(responses),
+        status_code=201,
+        media_type="application/json"
+    )
+
+
+@router.get("/{user_id}/{exercise_name}/latest-session", response_model=SessionResponse)
+async def get_latest_session(
+    user_id: str,
+    exercise_name: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve all sets from the most recent session of an exercise
+
+    Args:
+        user_id: Unique identifier for the user
+        exercise_name: Exercise name
+        db: Database session
+
+    Returns:
+        SessionResponse with the full set breakdown of the latest session
+    """
+    # Starlette has already URL-decoded the path parameter
+    session = await crud.get_latest_session(db, user_id, exercise_name)
+
+    if not session:
+        raise HTTPException(status_code=404, detail=f"No logs found for {user_id} and exercise {exercise_name}")
+
+    return session
+
+
+@router.get("/{user_id}/history", response_model=List[LogEntryResponse])
+async def get_history(
+    user_id: str,
+    exercise_name: Optional[str] = Query(None, description="Filter by exercise name"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of entries"),
+    stream: bool = Query(False, description="Stream entries as NDJSON"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve the most recent log entries for a user
+
+    Args:
+        user_id: Unique identifier for the user
+        exercise_name: Optional exercise name filter
+        limit: Maximum number of entries to return
+        stream: Stream entries as NDJSON instead of a JSON array
+        db: Database session
+
+    Returns:
+        List of LogEntryResponse (or an NDJSON stream), newest first
+    """
+    if stream:
+        entries = crud.stream_exercise_history(db, user_id, exercise_name, limit)
+
+        async def ndjson():
+            async for entry in entries:
+                yield orjson.dumps(entry.model_dump()) + b"\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    entries = await crud.get_exercise_history(db, user_id, exercise_name, limit)
+    return Response(
+        content=LOG_LIST_ADAPTER.dump_json(entries),
+        media_type="application/json"
+    )
+
+
+@router.delete("/{log_entry_id}")
+async def delete_log(
+    log_entry_id: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete a log entry (correction path for the append-only ledger)
+
+    Args:
+        log_entry_id: Log entry identifier
+        db: Database session
+
+    Returns:
+        Confirmation message
+    """
+    success = await crud.delete_log_entry(db, log_entry_id)
+
+    if not success:
+        raise HTTPException(status_code=404, detail=f"No log entry found with id {log_entry_id}")
+
+    return {"message": f"Log entry {log_entry_id} deleted successfully"}
@@ -0,0 +1,56 @@
+"""
+Database connection and session management
+"""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from models.db_models import Base
+from typing import AsyncIterator
+import os
+
+# Database URL - using SQLite for development
+DATABASE_URL = os.getenv("LDPS_DATABASE_URL", "sqlite+aiosqlite:///./ldps.db")
+
+# Pool sizing - SQLite allows a single writer, so the explicit pool only
+# applies to server databases (e.g. the PostgreSQL deployment path)
+if "sqlite" in DATABASE_URL:
+    pool_kwargs = {}
+else:
+    pool_kwargs = {
+        "pool_size": int(os.getenv("LDPS_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("LDPS_MAX_OVERFLOW", "40")),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+# Create async engine so commits never block the event loop
+engine = create_async_engine(DATABASE_URL, **pool_kwargs)
+
+if "sqlite" in DATABASE_URL:
+    # WAL lets readers run concurrently with the single writer, and
+    # synchronous=NORMAL drops the per-commit fsync that WAL makes safe.
+    # Runs once per pooled connection.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-50000")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+# Create session factory
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+
+async def init_db():
+    """Initialize database tables"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency for getting database sessions"""
+    async with async_session() as session:
+        yield session
@@ -0,0 +1,245 @@
+"""
+CRUD operations for database models
+"""
+
+from sqlalchemy import select, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Dict, Any, List
+from cachetools import TTLCache
+from models.db_models import LogEntry, uuid7
+from models.schemas import LogEntryResponse, SetData, SessionResponse
+from utils.session_clustering import SESSION_THRESHOLD
+
+# Latest-session answers only change when the user logs a new entry for
+# that exercise, so cache them briefly and invalidate on every write.
+# Lookups run on the event loop, so no lock is needed around the dict.
+_latest_session_cache = TTLCache(maxsize=10_000, ttl=60)
+
+# Prepared once at import: the hot latest-session query never changes
+# shape, so skip per-call clause construction and let the driver's
+# statement cache hit immediately. Walking the history newest first, a
+# gap above the threshold ends the latest session, so rows with a
+# running boundary count of zero form that session. julianday() makes
+# this SQLite-specific (window functions need 3.25+).
+_LATEST_SESSION_STMT = text(
+    """
+    WITH gaps AS (
+        SELECT set_number, weight_used, reps_completed,
+               duration, distance, rpe, timestamp,
+               CASE
+                   WHEN julianday(LAG(timestamp) OVER (ORDER BY timestamp DESC))
+                        - julianday(timestamp) > :threshold_days
+                   THEN 1 ELSE 0
+               END AS boundary
+        FROM log_entries
+        WHERE user_id = :user_id AND exercise_name = :exercise_name
+    )
+    SELECT set_number, weight_used, reps_completed,
+           duration, distance, rpe, timestamp
+    FROM (
+        SELECT gaps.*, SUM(boundary) OVER (ORDER BY timestamp DESC) AS session_index
+        FROM gaps
+    )
+    WHERE session_index = 0
+    ORDER BY set_number
+    """
+)
+
+
+async def create_log_entry(db: AsyncSession, entry_data: Dict[str, Any]) -> LogEntry:
+    """
+    Create a new log entry (append-only ledger)
+
+    Args:
+        db: Database session
+        entry_data: Dictionary containing log entry data
+
+    Returns:
+        Created LogEntry object
+    """
+    # A single append-only insert has no use for unit-of-work tracking;
+    # Core insert + RETURNING also spares the post-commit refresh round trip
+    result = await db.scalars(
+        insert(LogEntry)
+        .values(log_entry_id=str(uuid7()), **entry_data)
+        .returning(LogEntry)
+    )
+    entry = result.one()
+    await db.commit()
+    _latest_session_cache.pop((entry.user_id, entry.exercise_name), None)
+    return entry
+
+
+async def create_log_entries_bulk(db: AsyncSession, entries_data: List[Dict[str, Any]]) -> List[LogEntry]:
+    """
+    Create several log entries in a single transaction
+
+    Amortizes the per-commit fsync across a whole batch of sets.
+
+    Args:
+        db: Database session
+        entries_data: List of dictionaries containing log entry data
+
+    Returns:
+        List of created LogEntry objects, in input order
+    """
+    # An empty executemany parameter list would degenerate into a single
+    # defaults-only INSERT and trip the NOT NULL constraints
+    if not entries_data:
+        return []
+
+    rows = [
+        {"log_entry_id": str(uuid7()), **entry_data}
+        for entry_data in entries_data
+    ]
+    result = await db.scalars(
+        insert(LogEntry).returning(LogEntry, sort_by_parameter_order=True),
+        rows
+    )
+    entries = result.all()
+    await db.commit()
+    for entry in entries:
+        _latest_session_cache.pop((entry.user_id, entry.exercise_name), None)
+    return entries
+
+
+async def get_latest_session(db: AsyncSession, user_id: str, exercise_name: str) -> Optional[SessionResponse]:
+    """
+    Retrieve all sets from the most recent session of an exercise
+
+    Args:
+        db: Database session
+        user_id: User identifier
+        exercise_name: Exercise name
+
+    Returns:
+        SessionResponse or None if no logs exist
+    """
+    cache_key = (user_id, exercise_name)
+    cached = _latest_session_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        _LATEST_SESSION_STMT,
+        {
+            "user_id": user_id,
+            "exercise_name": exercise_name,
+            "threshold_days": SESSION_THRESHOLD.total_seconds() / 86400,
+        },
+    )
+    rows = result.mappings().all()
+
+    if not rows:
+        return None
+
+    sets = [SetData.model_validate(dict(row)) for row in rows]
+
+    session = SessionResponse(
+        user_id=user_id,
+        exercise_name=exercise_name,
+        session_start=min(s.timestamp for s in sets),
+        sets=sets
+    )
+    _latest_session_cache[cache_key] = session
+    return session
+
+
+async def get_exercise_history(
+    db: AsyncSession,
+    user_id: str,
+    exercise_name: Optional[str] = None,
+    limit: int = 100
+) -> List[LogEntryResponse]:
+    """
+    Retrieve the most recent log entries for a user
+
+    Args:
+        db: Database session
+        user_id: User identifier
+        exercise_name: Optional exercise name filter
+        limit: Maximum number of entries to return
+
+    Returns:
+        List of LogEntryResponse, newest first
+    """
+    # Project only the response columns: no ORM identity-map bookkeeping,
+    # and SQLite can serve the covered columns from the index pages
+    stmt = select(
+        LogEntry.log_entry_id,
+        LogEntry.user_id,
+        LogEntry.exercise_name,
+        LogEntry.timestamp,
+        LogEntry.set_number,
+        LogEntry.weight_used,
+        LogEntry.reps_completed,
+        LogEntry.duration,
+        LogEntry.distance,
+        LogEntry.rpe,
+    ).where(LogEntry.user_id == user_id)
+
+    if exercise_name:
+        stmt = stmt.where(LogEntry.exercise_name == exercise_name)
+
+    stmt = stmt.order_by(LogEntry.timestamp.desc()).limit(limit)
+    result = await db.execute(stmt)
+
+    return [LogEntryResponse.model_validate(dict(row)) for row in result.mappings()]
+
+
+async def stream_exercise_history(
+    db: AsyncSession,
+    user_id: str,
+    exercise_name: Optional[str] = None,
+    limit: int = 100
+):
+    """
+    Stream log entries without materializing the full result set
+
+    Rows are fetched from the server cursor in batches of 100 and yielded
+    one at a time, keeping peak memory at O(batch) instead of O(limit).
+
+    Args:
+        db: Database session
+        user_id: User identifier
+        exercise_name: Optional exercise name filter
+        limit: Maximum number of entries to stream
+
+    Yields:
+        LogEntryResponse objects, newest first
+    """
+    stmt = select(LogEntry).where(LogEntry.user_id == user_id)
+
+    if exercise_name:
+        stmt = stmt.where(LogEntry.exercise_name == exercise_name)
+
+    stmt = stmt.order_by(LogEntry.timestamp.desc()).limit(limit)
+    result = await db.stream(stmt.execution_options(yield_per=100))
+
+    async for log in result.scalars():
+        yield LogEntryResponse.model_validate(log)
+
+
+async def delete_log_entry(db: AsyncSession, log_entry_id: str) -> bool:
+    """
+    Delete a log entry (correction path for the append-only ledger)
+
+    Args:
+        db: Database session
+        log_entry_id: Log entry identifier
+
+    Returns:
+        True if deleted, False if not found
+    """
+    result = await db.execute(
+        select(LogEntry).where(LogEntry.log_entry_id == log_entry_id)
+    )
+    entry = result.scalar_one_or_none()
+
+    if not entry:
+        return False
+
+    _latest_session_cache.pop((entry.user_id, entry.exercise_name), None)
+    await db.delete(entry)
+    await db.commit()
+    return True
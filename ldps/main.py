@@ -0,0 +1,77 @@
+"""
+Main FastAPI application for L-DPS (Logbook & Data Persistence Service)
+"""
+
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+
+from api import logs
+from database.connection import init_db, engine
+import asyncio
+import os
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create tables, pre-warm the connection pool, dispose on shutdown"""
+    await init_db()
+
+    async def warm():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Open pool_size connections at once so the first burst of requests
+    # doesn't pay cold-connection setup (and PRAGMA configuration)
+    await asyncio.gather(*(warm() for _ in range(engine.pool.size() or 1)))
+
+    yield
+
+    await engine.dispose()
+
+
+app = FastAPI(
+    title="L-DPS API",
+    description="Logbook & Data Persistence Service for Progressive Overload Log",
+    version="0.1.0",
+    # orjson serializes the datetime/float-heavy log payloads in C
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Configure CORS - a concrete origin list is required for credentialed
+# requests, and max_age lets browsers cache the preflight for a day
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[os.getenv("SRE_ORIGIN", "http://localhost:3000")],
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
+)
+
+# Include API routes
+app.include_router(logs.router, prefix="/api/v1/logs", tags=["logs"])
+
+# Routes no longer wrap their bodies in try/except Exception; unexpected
+# errors are mapped to a generic 500 here, off the hot path
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Serve a generic 500 for unexpected errors"""
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+@app.get("/")
+async def root():
+    """Health check endpoint"""
+    return {
+        "service": "L-DPS",
+        "status": "operational",
+        "version": "0.1.0"
+    }
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=True)
@@ -0,0 +1,3 @@
+"""
+Data models for L-DPS
+"""
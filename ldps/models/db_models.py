@@ -0,0 +1,80 @@
+"""
+SQLAlchemy database models
+"""
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, func
+from sqlalchemy.ext.declarative import declarative_base
+import os
+import time
+import uuid
+
+Base = declarative_base()
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (draft RFC 9562 layout)
+
+    The top 48 bits are a millisecond timestamp, so keys are generated in
+    nearly ascending order and inserts append to the right edge of the
+    WITHOUT ROWID primary-key B-tree instead of splitting random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), "big") & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0x2 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+class LogEntry(Base):
+    """Immutable log entry for a single performed set"""
+    __tablename__ = "log_entries"
+
+    log_entry_id = Column(String, primary_key=True, default=lambda: str(uuid7()))
+    user_id = Column(String, nullable=False, index=True)
+    exercise_name = Column(String, nullable=False, index=True)
+    # Timestamps are assigned by the database, not per-insert Python calls
+    timestamp = Column(DateTime, server_default=func.now(), nullable=False)
+    set_number = Column(Integer, nullable=False)
+    weight_used = Column(Float, nullable=True)
+    reps_completed = Column(Integer, nullable=True)
+    duration = Column(Float, nullable=True)
+    distance = Column(Float, nullable=True)
+    rpe = Column(Float, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    # WITHOUT ROWID stores rows directly in the primary-key B-tree, so the
+    # per-UUID fetch path walks one tree instead of autoindex + rowid table
+    # Trailing columns make this a covering index: the history query can be
+    # answered from index pages alone, without per-row table lookups
+    __table_args__ = (
+        Index(
+            "idx_user_exercise_time_cover",
+            "user_id",
+            "exercise_name",
+            "timestamp",
+            "set_number",
+            "weight_used",
+            "reps_completed",
+            "duration",
+            "distance",
+            "rpe",
+        ),
+        {"sqlite_with_rowid": False},
+    )
+
+
+# Descending index so the hot ORDER BY timestamp DESC LIMIT 1 anchor query
+# is a forward index scan instead of a reverse walk or temp B-tree sort
+Index(
+    "idx_user_exercise_time_desc",
+    LogEntry.user_id,
+    LogEntry.exercise_name,
+    LogEntry.timestamp.desc(),
+)
@@ -0,0 +1,55 @@
+"""
+Pydantic schemas for request/response validation
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+
+class LogEntryBase(BaseModel):
+    """Base schema for log entry data"""
+    user_id: str = Field(..., description="User identifier")
+    exercise_name: str = Field(..., description="Exercise name")
+    set_number: int = Field(..., description="Set number within the session")
+    weight_used: Optional[float] = Field(None, description="Weight used (kg/lbs)")
+    reps_completed: Optional[int] = Field(None, description="Number of reps completed")
+    duration: Optional[float] = Field(None, description="Duration in seconds")
+    distance: Optional[float] = Field(None, description="Distance covered")
+    rpe: Optional[float] = Field(None, description="Rate of perceived exertion")
+
+
+class LogEntryCreate(LogEntryBase):
+    """Schema for creating a log entry"""
+    pass
+
+
+class LogEntryResponse(LogEntryBase):
+    """Schema for log entry response"""
+    log_entry_id: str
+    timestamp: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SetData(BaseModel):
+    """Schema for a single set within a session"""
+    set_number: int
+    weight_used: Optional[float] = None
+    reps_completed: Optional[int] = None
+    duration: Optional[float] = None
+    distance: Optional[float] = None
+    rpe: Optional[float] = None
+    timestamp: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SessionResponse(BaseModel):
+    """Schema for the most recent session of an exercise"""
+    user_id: str
+    exercise_name: str
+    session_start: datetime
+    sets: List[SetData] = Field(default=[], description="All sets of the session")
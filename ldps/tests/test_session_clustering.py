@@ -0,0 +1,66 @@
+"""
+Unit tests for session clustering
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from utils.session_clustering import (
+    cluster_logs_into_sessions,
+    get_latest_session_from_logs,
+)
+
+
+class FakeLog:
+    """Lightweight stand-in for a LogEntry row"""
+
+    def __init__(self, timestamp, set_number):
+        self.timestamp = timestamp
+        self.set_number = set_number
+
+
+def make_session(start, num_sets):
+    """Build one session of logs, newest first, one minute between sets"""
+    return [
+        FakeLog(start + timedelta(minutes=num_sets - i), set_number=num_sets - i)
+        for i in range(num_sets)
+    ]
+
+
+class TestSessionClustering:
+    """Test cases for session clustering functions"""
+
+    def test_empty_logs_return_no_sessions(self):
+        """Test that empty input yields no sessions"""
+        assert cluster_logs_into_sessions([]) == []
+        assert get_latest_session_from_logs([]) == []
+
+    def test_single_session_sorted_by_set_number(self):
+        """Test that one cluster of logs is returned sorted by set number"""
+        start = datetime(2025, 1, 6, 18, 0)
+        logs = make_session(start, 3)
+
+        latest = get_latest_session_from_logs(logs)
+
+        assert [log.set_number for log in latest] == [1, 2, 3]
+
+    def test_sessions_split_on_threshold_gap(self):
+        """Test that a gap above the threshold starts a new session"""
+        recent = make_session(datetime(2025, 1, 8, 18, 0), 3)
+        older = make_session(datetime(2025, 1, 6, 18, 0), 4)
+
+        sessions = cluster_logs_into_sessions(recent + older)
+
+        assert len(sessions) == 2
+        assert len(sessions[0]) == 3
+        assert len(sessions[1]) == 4
+
+    def test_latest_session_is_most_recent(self):
+        """Test that only the most recent session is returned"""
+        recent = make_session(datetime(2025, 1, 8, 18, 0), 2)
+        older = make_session(datetime(2025, 1, 6, 18, 0), 5)
+
+        latest = get_latest_session_from_logs(recent + older)
+
+        assert [log.set_number for log in latest] == [1, 2]
+        assert all(log.timestamp >= datetime(2025, 1, 8) for log in latest)
@@ -0,0 +1,125 @@
+"""
+Session clustering utilities
+
+A "session" is a cluster of log entries with close timestamps for the same
+user and exercise (PRD F.5.0). Two consecutive entries belong to the same
+session when the gap between them is below the session threshold.
+"""
+
+from datetime import timedelta
+from operator import attrgetter
+from typing import List
+
+import numpy as np
+
+# Maximum gap between two sets of the same workout session
+SESSION_THRESHOLD = timedelta(hours=4)
+
+# C-implemented sort key - no Python frame per compared element
+_BY_SET = attrgetter("set_number")
+
+# Histories shorter than this are clustered with plain Python loops; the
+# array setup cost outweighs the vectorized scan below it
+_VECTORIZE_THRESHOLD = 64
+
+
+def _logs_to_arrays(logs: List):
+    """Pull the timestamp and set_number columns into parallel arrays"""
+    timestamps = np.fromiter(
+        (log.timestamp.timestamp() for log in logs),
+        dtype=np.float64,
+        count=len(logs),
+    )
+    set_numbers = np.fromiter(
+        (log.set_number for log in logs),
+        dtype=np.int32,
+        count=len(logs),
+    )
+    return timestamps, set_numbers
+
+
+def cluster_logs_into_sessions(all_logs: List, session_threshold: timedelta = SESSION_THRESHOLD) -> List[List]:
+    """
+    Group log entries into workout sessions
+
+    Args:
+        all_logs: Log entries ordered by timestamp descending (newest first)
+        session_threshold: Maximum gap between entries of the same session
+
+    Returns:
+        List of sessions (newest first), each sorted by set number
+    """
+    if not all_logs:
+        return []
+
+    if len(all_logs) < _VECTORIZE_THRESHOLD:
+        sessions = []
+        current_session = [all_logs[0]]
+
+        for i in range(1, len(all_logs)):
+            previous = all_logs[i - 1]
+            current = all_logs[i]
+
+            if previous.timestamp - current.timestamp > session_threshold:
+                sessions.append(sorted(current_session, key=_BY_SET))
+                current_session = []
+
+            current_session.append(current)
+
+        if current_session:
+            sessions.append(sorted(current_session, key=_BY_SET))
+
+        return sessions
+
+    # Column-wise view of the history: session boundaries and per-session
+    # set ordering come out of vector ops instead of per-element timedelta
+    # arithmetic and Python-level comparisons
+    timestamps, set_numbers = _logs_to_arrays(all_logs)
+    gaps = timestamps[:-1] - timestamps[1:]
+    boundaries = np.flatnonzero(gaps > session_threshold.total_seconds()) + 1
+
+    sessions = []
+    for group in np.split(np.arange(len(all_logs)), boundaries):
+        order = group[np.argsort(set_numbers[group], kind="stable")]
+        sessions.append([all_logs[i] for i in order])
+
+    return sessions
+
+
+def get_latest_session_from_logs(all_logs: List, session_threshold: timedelta = SESSION_THRESHOLD) -> List:
+    """
+    Extract the most recent session from a log history
+
+    Args:
+        all_logs: Log entries ordered by timestamp descending (newest first)
+        session_threshold: Maximum gap between entries of the same session
+
+    Returns:
+        Log entries of the most recent session, sorted by set number
+    """
+    if not all_logs:
+        return []
+
+    # For short histories the array setup outweighs the scan: walk from the
+    # newest entry and stop at the first boundary, never touching the rest
+    if len(all_logs) < _VECTORIZE_THRESHOLD:
+        current_session = [all_logs[0]]
+        for i in range(1, len(all_logs)):
+            if all_logs[i - 1].timestamp - all_logs[i].timestamp > session_threshold:
+                break
+            current_session.append(all_logs[i])
+        return sorted(current_session, key=_BY_SET)
+
+    # Only the first boundary matters here, so vectorize: one diff over the
+    # timestamp array and an argmax on the gap mask replace the per-element
+    # timedelta arithmetic and Python-level branching of full clustering
+    timestamps = np.fromiter(
+        (log.timestamp.timestamp() for log in all_logs),
+        dtype=np.float64,
+        count=len(all_logs),
+    )
+    gaps = timestamps[:-1] - timestamps[1:]
+    mask = gaps > session_threshold.total_seconds()
+    boundary = int(mask.argmax()) if mask.any() else len(all_logs) - 1
+
+    return sorted(all_logs[:boundary + 1], key=_BY_SET)
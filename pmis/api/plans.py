@@ -2,29 +2,40 @@
 API endpoints for training plan management
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, Request, UploadFile, File, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
+from collections import OrderedDict
+import hashlib
+import os
+import tempfile
 
 from database.connection import get_db
 from models.schemas import PlanResponse, DailyWorkoutResponse
 from parsers.pdf_parser import PDFParser
-from extractors.plan_extractor import PlanExtractor
 from database import crud
 
 router = APIRouter()
 
+# Re-uploads of an identical PDF are common (edits, retries); memoize the
+# extracted plan structure keyed by content hash, LRU-capped
+_EXTRACT_CACHE = OrderedDict()
+_EXTRACT_CACHE_SIZE = 128
+
 
 @router.post("/upload", response_model=dict, status_code=201)
 async def upload_plan(
+    request: Request,
     user_id: str,
     file: UploadFile = File(...),
     db: Session = Depends(get_db)
 ):
     """
     Upload and parse a training plan PDF
-    
+
     Args:
+        request: Incoming request (provides the shared extractor)
         user_id: Unique identifier for the user
         file: PDF file containing the training plan
         db: Database session
@@ -37,26 +48,51 @@ async def upload_plan(
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
     try:
-        # Read PDF content
-        pdf_content = await file.read()
-        
-        # Parse PDF to extract text
-        parser = PDFParser()
-        raw_text = parser.parse(pdf_content)
-        
-        # Extract structured data from text
-        extractor = PlanExtractor()
-        plan_data = extractor.extract(raw_text, user_id)
-        
+        # Spool the upload to disk instead of buffering the whole PDF in
+        # memory, hashing it on the way through; PyMuPDF maps pages from
+        # the file on demand. The temp file is removed whichever way the
+        # spool or parse exits
+        digest = hashlib.blake2b(digest_size=16)
+        tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        try:
+            with tmp:
+                # Async reads yield to the event loop between chunks
+                while chunk := await file.read(1 << 20):
+                    digest.update(chunk)
+                    tmp.write(chunk)
+
+            cache_key = (digest.hexdigest(), user_id)
+            plan_data = _EXTRACT_CACHE.get(cache_key)
+
+            if plan_data is not None:
+                # Same PDF seen before - skip the parse and NLP entirely
+                _EXTRACT_CACHE.move_to_end(cache_key)
+            else:
+                # Parsing is CPU-bound; run it off the event loop so
+                # concurrent requests aren't blocked behind it
+                parser = PDFParser.default()
+                raw_text = await run_in_threadpool(parser.parse, tmp.name)
+        finally:
+            os.unlink(tmp.name)
+
+        if plan_data is None:
+            # Extract structured data with the extractor loaded at startup
+            extractor = request.app.state.plan_extractor
+            plan_data = await run_in_threadpool(extractor.extract, raw_text, user_id)
+
+            _EXTRACT_CACHE[cache_key] = plan_data
+            if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_SIZE:
+                _EXTRACT_CACHE.popitem(last=False)
+
         # Store in database
         plan = crud.create_plan(db, plan_data)
-        
+
         return {
             "message": "Plan uploaded successfully",
             "plan_id": plan.plan_id,
             "user_id": user_id
         }
-        
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing plan: {str(e)}")
 
@@ -0,0 +1,43 @@
+"""
+In-process TTL cache for plan read paths
+
+Plans only change on upload or delete, so hot reads can skip the SQL
+round trip entirely. Entries expire after a short TTL and are dropped
+eagerly whenever a user's plan is written.
+"""
+
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+# Cached responses stay valid this long unless invalidated by a write
+CACHE_TTL = 300  # seconds
+
+_cache = {}  # key -> (expiry, value)
+_lock = threading.Lock()
+
+
+def get(key: Tuple) -> Optional[Any]:
+    """Return the cached value for key, or None if missing/expired"""
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if expiry < time.monotonic():
+            del _cache[key]
+            return None
+        return value
+
+
+def set(key: Tuple, value: Any) -> None:
+    """Store value under key with the default TTL"""
+    with _lock:
+        _cache[key] = (time.monotonic() + CACHE_TTL, value)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop all cached entries for a user (called on plan writes)"""
+    with _lock:
+        for key in [k for k in _cache if k[1] == user_id]:
+            del _cache[key]
@@ -2,7 +2,7 @@
 Database connection and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from models.db_models import Base
 import os
@@ -10,12 +10,34 @@ import os
 # Database URL - using SQLite for development
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./pmis.db")
 
+# Explicit pool sizing for server databases; SQLite uses its own pooling
+# and file locking, so the kwargs only apply off the development default
+_pool_kwargs = {} if "sqlite" in DATABASE_URL else {
+    "pool_size": int(os.getenv("POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("MAX_OVERFLOW", "10")),
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    **_pool_kwargs
 )
 
+if "sqlite" in DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        """Tune SQLite for concurrent reads and fewer fsyncs per commit"""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
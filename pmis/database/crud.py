@@ -2,10 +2,11 @@
 CRUD operations for database models
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional, Dict, Any
 from models.db_models import Plan, DailyWorkout, Exercise
 from models.schemas import DailyWorkoutResponse, PlanResponse, ExerciseResponse
+import cache
 import uuid
 
 
@@ -28,7 +29,8 @@ def create_plan(db: Session, plan_data: Dict[str, Any]) -> Plan:
     db.add(plan)
     db.flush()  # Get the plan_id
     
-    # Create workouts and exercises
+    # Create all workouts first with a single flush to assign workout_ids
+    workouts = []
     for workout_data in plan_data.get("workouts", []):
         workout = DailyWorkout(
             plan_id=plan.plan_id,
@@ -36,20 +38,25 @@ def create_plan(db: Session, plan_data: Dict[str, Any]) -> Plan:
             target_body_parts=workout_data.get("target_body_parts", [])
         )
         db.add(workout)
-        db.flush()  # Get the workout_id
-        
-        # Create exercises
-        for exercise_data in workout_data.get("exercises", []):
-            exercise = Exercise(
-                workout_id=workout.workout_id,
-                name=exercise_data["name"],
-                sets=exercise_data.get("sets"),
-                reps=exercise_data.get("reps")
-            )
-            db.add(exercise)
-    
+        workouts.append(workout)
+    db.flush()  # Get the workout_ids
+
+    # Bulk-insert exercises, skipping per-object unit-of-work tracking
+    exercises = [
+        Exercise(
+            workout_id=workout.workout_id,
+            name=exercise_data["name"],
+            sets=exercise_data.get("sets"),
+            reps=exercise_data.get("reps")
+        )
+        for workout, workout_data in zip(workouts, plan_data.get("workouts", []))
+        for exercise_data in workout_data.get("exercises", [])
+    ]
+    db.bulk_save_objects(exercises)
+
     db.commit()
     db.refresh(plan)
+    cache.invalidate_user(plan.user_id)
     return plan
 
 
@@ -64,11 +71,23 @@ def get_plan_by_user(db: Session, user_id: str) -> Optional[PlanResponse]:
     Returns:
         PlanResponse or None if not found
     """
-    plan = db.query(Plan).filter(Plan.user_id == user_id).order_by(Plan.created_at.desc()).first()
-    
+    cached = cache.get(("plan", user_id))
+    if cached is not None:
+        return cached
+
+    # Eager-load workouts and their exercises up front; iterating the
+    # relationships below then triggers no lazy SELECT per workout
+    plan = (
+        db.query(Plan)
+        .options(selectinload(Plan.workouts).selectinload(DailyWorkout.exercises))
+        .filter(Plan.user_id == user_id)
+        .order_by(Plan.created_at.desc())
+        .first()
+    )
+
     if not plan:
         return None
-    
+
     # Build response
     workouts = []
     for workout in plan.workouts:
@@ -82,12 +101,14 @@ def get_plan_by_user(db: Session, user_id: str) -> Optional[PlanResponse]:
             "exercises": exercises
         })
     
-    return PlanResponse(
+    response = PlanResponse(
         plan_id=plan.plan_id,
         user_id=plan.user_id,
         created_at=plan.created_at.isoformat(),
         workouts=workouts
     )
+    cache.set(("plan", user_id), response)
+    return response
 
 
 def get_daily_workout(db: Session, user_id: str, day: str) -> Optional[DailyWorkoutResponse]:
@@ -102,34 +123,45 @@ def get_daily_workout(db: Session, user_id: str, day: str) -> Optional[DailyWork
     Returns:
         DailyWorkoutResponse or None if not found
     """
-    # Get the most recent plan for the user
-    plan = db.query(Plan).filter(Plan.user_id == user_id).order_by(Plan.created_at.desc()).first()
-    
-    if not plan:
-        return None
-    
-    # Get the workout for the specified day
-    workout = db.query(DailyWorkout).filter(
-        DailyWorkout.plan_id == plan.plan_id,
-        DailyWorkout.day == day
-    ).first()
-    
+    cached = cache.get(("workout", user_id, day))
+    if cached is not None:
+        return cached
+
+    # Scalar subquery pins the lookup to the user's newest plan, so a
+    # day missing from it is a miss rather than a hit on a superseded
+    # plan; exercises are eager-loaded in the same round trip
+    latest_plan_id = (
+        db.query(Plan.plan_id)
+        .filter(Plan.user_id == user_id)
+        .order_by(Plan.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    workout = (
+        db.query(DailyWorkout)
+        .filter(DailyWorkout.plan_id == latest_plan_id, DailyWorkout.day == day)
+        .options(selectinload(DailyWorkout.exercises))
+        .first()
+    )
+
     if not workout:
         return None
-    
+
     # Build exercises list
     exercises = [
         {"name": ex.name, "sets": ex.sets, "reps": ex.reps}
         for ex in workout.exercises
     ]
     
-    return DailyWorkoutResponse(
+    response = DailyWorkoutResponse(
         workout_id=workout.workout_id,
-        plan_id=plan.plan_id,
+        plan_id=workout.plan_id,
         day=workout.day,
         target_body_parts=workout.target_body_parts,
         exercises=exercises
     )
+    cache.set(("workout", user_id, day), response)
+    return response
 
 
 def delete_plan(db: Session, user_id: str) -> bool:
@@ -150,4 +182,5 @@ def delete_plan(db: Session, user_id: str) -> bool:
     
     db.delete(plan)
     db.commit()
+    cache.invalidate_user(user_id)
     return True
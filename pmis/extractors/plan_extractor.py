@@ -17,6 +17,12 @@ class PlanExtractor:
         "chest", "back", "shoulders", "legs", "arms", "biceps", "triceps",
         "quads", "hamstrings", "glutes", "calves", "abs", "core", "forearms"
     ]
+    # One compiled alternation walks the text once instead of running a
+    # separate substring scan per body part
+    _BODY_RE = re.compile(
+        r"\b(" + "|".join(map(re.escape, BODY_PARTS)) + r")\b",
+        re.IGNORECASE
+    )
     
     # Days of the week and other patterns
     DAYS = {
@@ -28,12 +34,39 @@ class PlanExtractor:
         "saturday": "Saturday", "sat": "Saturday",
         "sunday": "Sunday", "sun": "Sunday",
     }
-    DAY_PATTERN = re.compile(r"(day|workout|session)[-:\s]*(\d+)", re.IGNORECASE)
-    
+    # Named and numbered day headers detected with a single alternation,
+    # one scan per line instead of a per-key token check plus a second
+    # pattern search
+    _DAY_DETECT_RE = re.compile(
+        r"\b(?P<name>" + "|".join(map(re.escape, DAYS)) + r")\b"
+        r"|(?:day|workout|session)[-:\s]*(?P<num>\d+)",
+        re.IGNORECASE
+    )
+
+    # Compiled once at class creation so the per-line loop in
+    # _extract_exercises never hits the re module's pattern cache
+    _SKIP_RE = re.compile(r'^(Set|Sets|Reps?|Duration|Weight)[:\s\d]', re.IGNORECASE)
+    # One alternation scans a data line once for all set/rep fields
+    # instead of running a separate pass per pattern
+    _NEXTLINE_RE = re.compile(
+        r'(?P<sets_max>Sets?\s+\d+[–-]?(?P<sets_n>\d+))'
+        r'|(?P<set_single>Set\s+\d+)'
+        r'|(?P<reps>Reps?[:\s]+(?P<reps_n>\d+))',
+        re.IGNORECASE
+    )
+    _SXR_RE = re.compile(r'(\d+)\s*[x×]\s*(\d+)', re.IGNORECASE)
+    _PAREN_RE = re.compile(r'\s*\([^)]+\)\s*$')
+    _PREFIX_RE = re.compile(r'^[-•*\d.)\s]+')
+
     def __init__(self):
         """Initialize the extractor with spaCy model"""
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            # Only tokenization is needed; skip the expensive pipeline
+            # components so load time and per-doc cost stay low
+            self.nlp = spacy.load(
+                "en_core_web_sm",
+                disable=["parser", "ner", "lemmatizer", "attribute_ruler"]
+            )
         except OSError:
             # Model not found - will need to be downloaded
             raise RuntimeError(
@@ -84,20 +117,16 @@ class PlanExtractor:
         current_content = []
         
         for line in lines:
-            line_lower = line.lower().strip()
             found_day = None
 
-            # Check for name patterns first (e.g., Monday)
-            for day_key, day_name in self.DAYS.items():
-                if day_key in line_lower.split():
-                    found_day = day_name
+            # Name patterns (e.g., Monday) take precedence over numbered
+            # ones (e.g., Day 1); both come out of the same scan
+            for match in self._DAY_DETECT_RE.finditer(line):
+                if match.group("name"):
+                    found_day = self.DAYS[match.group("name").lower()]
                     break
-            
-            # If no name, check for numbered patterns (e.g., Day 1)
-            if not found_day:
-                match = self.DAY_PATTERN.search(line_lower)
-                if match:
-                    found_day = f"Day {match.group(2)}"
+                if found_day is None:
+                    found_day = f"Day {match.group('num')}"
             
             if found_day:
                 # Save previous day's content
@@ -152,15 +181,10 @@ class PlanExtractor:
         Returns:
             List of body part names
         """
-        content_lower = content.lower()
-        found_parts = []
-        
-        for part in self.BODY_PARTS:
-            if part in content_lower:
-                found_parts.append(part.capitalize())
-        
+        found_parts = self._BODY_RE.findall(content)
+
         # Remove duplicates while preserving order
-        return list(dict.fromkeys(found_parts))
+        return list(dict.fromkeys(part.capitalize() for part in found_parts))
     
     def _extract_exercises(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -184,7 +208,7 @@ class PlanExtractor:
                 continue
             
             # Skip lines that look like data lines (not exercise names)
-            if re.search(r'^(Set|Sets|Reps?|Duration|Weight)[:\s\d]', line, re.IGNORECASE):
+            if self._SKIP_RE.search(line):
                 continue
             
             # This line is a potential exercise name
@@ -195,18 +219,15 @@ class PlanExtractor:
             if i < len(lines):
                 next_line = lines[i].strip()
                 
-                # Try to extract sets and reps from the next line
-                # Pattern 1: "Sets 1–4" or "Set 1"
-                sets_match = re.search(r'Sets?\s+\d+[–-]?(\d+)', next_line, re.IGNORECASE)
-                if sets_match:
-                    sets = int(sets_match.group(1))
-                elif re.search(r'Set\s+\d+', next_line, re.IGNORECASE):
-                    sets = 1  # Single set
-                
-                # Pattern 2: "Reps: 10" or "Reps: 10 each"
-                reps_match = re.search(r'Reps?[:\s]+(\d+)', next_line, re.IGNORECASE)
-                if reps_match:
-                    reps = int(reps_match.group(1))
+                # Extract sets ("Sets 1–4" or "Set 1") and reps ("Reps: 10")
+                # from the next line in a single scan
+                for match in self._NEXTLINE_RE.finditer(next_line):
+                    if sets is None and match.group('sets_max'):
+                        sets = int(match.group('sets_n'))
+                    elif sets is None and match.group('set_single'):
+                        sets = 1  # Single set
+                    elif reps is None and match.group('reps'):
+                        reps = int(match.group('reps_n'))
                 
                 # If we found data on the next line, consume it
                 if sets is not None or reps is not None:
@@ -214,7 +235,7 @@ class PlanExtractor:
             
             # Try single-line format as fallback (e.g., "Bench Press 3x10")
             if sets is None and reps is None:
-                single_line_match = re.search(r'(\d+)\s*[x×]\s*(\d+)', line, re.IGNORECASE)
+                single_line_match = self._SXR_RE.search(line)
                 if single_line_match:
                     sets = int(single_line_match.group(1))
                     reps = int(single_line_match.group(2))
@@ -222,12 +243,12 @@ class PlanExtractor:
             
             # Clean up exercise name
             # Remove body part in parentheses (e.g., "(Chest)")
-            exercise_name = re.sub(r'\s*\([^)]+\)\s*$', '', exercise_name)
+            exercise_name = self._PAREN_RE.sub('', exercise_name)
             # Remove common prefixes
-            exercise_name = re.sub(r'^[-•*\d.)\s]+', '', exercise_name).strip()
-            
+            exercise_name = self._PREFIX_RE.sub('', exercise_name).strip()
+
             # Add to list if valid (must have actual text)
-            if len(exercise_name) > 2 and re.search(r'[a-zA-Z]{2,}', exercise_name):
+            if len(exercise_name) > 2 and self._has_alpha_run(exercise_name):
                 exercises.append({
                     "name": exercise_name,
                     "sets": sets,
@@ -235,3 +256,25 @@ class PlanExtractor:
                 })
         
         return exercises
+
+    @staticmethod
+    def _has_alpha_run(text: str) -> bool:
+        """
+        Check whether text contains two consecutive letters
+
+        Valid exercise names almost always start with letters, so this
+        short-circuits far sooner than a regex scan of the whole string.
+
+        Args:
+            text: Candidate exercise name
+
+        Returns:
+            True if two consecutive alphabetic characters are found
+        """
+        previous = False
+        for char in text:
+            current = char.isalpha()
+            if current and previous:
+                return True
+            previous = current
+        return False
@@ -2,11 +2,14 @@
 Main FastAPI application for P-MIS (Plan Management & Ingestion Service)
 """
 
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api import plans
 from database.connection import init_db
+from extractors.plan_extractor import PlanExtractor
 
 app = FastAPI(
     title="P-MIS API",
@@ -26,8 +29,11 @@ app.add_middleware(
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables on application startup"""
+    """Initialize database tables and shared extractor on startup"""
     init_db()
+    # Loading the spaCy model takes seconds - do it once here instead of
+    # on every upload request
+    app.state.plan_extractor = PlanExtractor()
 
 # Include API routes
 app.include_router(plans.router, prefix="/api/v1/plans", tags=["plans"])
@@ -43,4 +49,4 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run("main:app", host="0.0.0.0", port=int(os.getenv("PMIS_PORT", "8000")), reload=True)
@@ -2,7 +2,7 @@
 SQLAlchemy database models
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
@@ -16,10 +16,14 @@ class Plan(Base):
     __tablename__ = "plans"
     
     plan_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, nullable=False, index=True)
+    user_id = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+
+    # Covers the "latest plan for user" lookup without a separate sort;
+    # subsumes the old scalar index on user_id
+    __table_args__ = (Index("ix_plans_user_created", "user_id", "created_at"),)
+
     # Relationships
     workouts = relationship("DailyWorkout", back_populates="plan", cascade="all, delete-orphan")
 
@@ -32,7 +36,10 @@ class DailyWorkout(Base):
     plan_id = Column(String, ForeignKey("plans.plan_id"), nullable=False)
     day = Column(String, nullable=False)
     target_body_parts = Column(JSON, default=[])
-    
+
+    # The (plan_id, day) filter in get_daily_workout hits this directly
+    __table_args__ = (Index("ix_workouts_plan_day", "plan_id", "day"),)
+
     # Relationships
     plan = relationship("Plan", back_populates="workouts")
     exercises = relationship("Exercise", back_populates="workout", cascade="all, delete-orphan")
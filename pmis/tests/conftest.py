@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the test suite
+"""
+
+import hashlib
+import pickle
+from pathlib import Path
+
+import pytest
+
+import parsers.pdf_parser
+from parsers.pdf_parser import PDFParser
+
+
+@pytest.fixture(scope="session")
+def parser(pytestconfig):
+    """Shared parser, rebuilt only when the parser module changes
+
+    The constructed instance is pickled into pytest's cache keyed by a
+    hash of the module source, so repeat runs (including separate CI
+    jobs sharing the cache dir) skip construction; any edit to the
+    parser module changes the key and invalidates the entry.
+    """
+    mod_hash = hashlib.sha256(Path(parsers.pdf_parser.__file__).read_bytes()).hexdigest()
+    key = f"pdf_parser/instance/{mod_hash}"
+    cached = pytestconfig.cache.get(key, None)
+    if cached:
+        return pickle.loads(bytes.fromhex(cached))
+    parser = PDFParser()
+    pytestconfig.cache.set(key, pickle.dumps(parser).hex())
+    return parser